@@ -1,20 +1,29 @@
-import json
+import asyncio
+import atexit
+import os
+import queue
 import re
+import threading
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from hashlib import md5
+from functools import lru_cache
 from io import BytesIO
 from logging import getLogger
-from time import sleep
+from tempfile import SpooledTemporaryFile
 from typing import Any, Callable, Generator, Iterable, List, Optional, Tuple, TypeVar
 
+import aiohttp
 import coloredlogs
+import orjson
 import pymongo
 import requests
 import toml
+from cachetools import LRUCache, TTLCache
 from oauthlib import oauth1
 from PIL import Image, ImageDraw, ImageFont
+from requests.adapters import HTTPAdapter, Retry
 
 coloredlogs.install()
 
@@ -32,20 +41,29 @@ if config["render"]["renderer"] == "pyansi":
     
 elif config["render"]["renderer"] == "infekt":
     import subprocess
-    from tempfile import NamedTemporaryFile
 
 
-OLD_HASH_SET = set()
+SEEN_RELEASES = set()
+
+NFO_FONT = ImageFont.truetype(
+    config["render"]["font_path"],
+    size=config["render"]["font_size"],
+    encoding='unic'
+)
 
 DEBUG = config["common"]["debug"]
 NEWLINE = "\n"
 TITLE_ID_BASE_MASK = 0xFFFFFFFFFFFFE000
-TITLE_ID_REGEX = re.compile(r"01[A-Fa-f0-9X]{12,}")
+TITLE_ID_REGEX = re.compile(rb"01[A-Fa-f0-9X]{12,}")
 ONE_MINUTE = 60
 ONE_HOUR = 60 * ONE_MINUTE
+POST_COOLDOWN = 5
+MAX_MEDIA_BYTES = 10 * 1024 * 1024
+SPOOL_MAX_BYTES = 1024 * 1024
+SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
 CACHE = {
-    "releases": {},
-    "nfos": {}
+    "releases": LRUCache(maxsize=2048),
+    "nfos": TTLCache(maxsize=2048, ttl=6 * ONE_HOUR)
 }
 COLORS = {
         "info": 0x00ffe0,
@@ -54,22 +72,107 @@ COLORS = {
         "critical": 0xff0000
     }
 
+SCAN_STATE = {"etag": None}
+
 SRRDB_SCAN_URL = "https://api.srrdb.com/v1/search/category:nsw/order:date-desc"
 SRRDB_RELEASE_URL = "https://api.srrdb.com/v1/details/{release_name}"
 SRRDB_FILE_URL = "https://www.srrdb.com/download/file/{release_name}/{file_name}"
 SRRDB_ADD_URL = "https://www.srrdb.com/download/temp/{release_name}/{add_id}/{file_name}"
 TINFOIL_URL = "https://tinfoil.media/ti/{title_id}/1024/1024/"
+TINFOIL_TITLE_URL = "https://tinfoil.io/Title/{title_id}"
+ESHOP_URL = "https://ec.nintendo.com/apps/{title_id}/US"
 
 TWITTER_BASE_URL = "https://twitter.com"
 TWITTER_MEDIA_ENDPOINT_URL = 'https://upload.twitter.com/1.1/media/upload.json'
 POST_TWEET_URL = 'https://api.twitter.com/2/tweets'
 
 
+SESSION = requests.Session()
+SESSION_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+)
+SESSION.mount("http://", SESSION_ADAPTER)
+SESSION.mount("https://", SESSION_ADAPTER)
+atexit.register(SESSION.close)
+
+AIOHTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+RENDER_POOL = ProcessPoolExecutor(max_workers=2)
+
+OAUTH_CLIENT = oauth1.Client(
+    client_key              = config["twitter"]["consumer_key"],
+    client_secret           = config["twitter"]["consumer_secret"],
+    resource_owner_key      = config["twitter"]["access_token"],
+    resource_owner_secret   = config["twitter"]["access_token_secret"],
+)
+
+
 mongo_client = pymongo.MongoClient(
     host=config["mongo"]["url"],
 )[config["mongo"]["collection"]]
 
 
+INSERT_QUEUE = queue.Queue()
+INSERT_BATCH_SIZE = 100
+
+
+def drain_insert_queue():
+    while True:
+        batch = [INSERT_QUEUE.get()]
+
+        try:
+            while len(batch) < INSERT_BATCH_SIZE:
+                batch.append(INSERT_QUEUE.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            mongo_client.releases.insert_many(batch, ordered=False)
+        except pymongo.errors.PyMongoError as exception:
+            log("error", f"[MDB] Bulk insert failed: ```{format_exception(exception)}```")
+
+
+def init_mongo():
+    if not config["mongo"]["enabled"]:
+        return
+
+    mongo_client.seen.create_index("release", unique=True)
+    mongo_client.nfos.create_index("release", unique=True)
+
+    threading.Thread(target=drain_insert_queue, daemon=True).start()
+
+    SEEN_RELEASES.update(
+        doc["release"] for doc in mongo_client.seen.find({}, {"release": 1})
+    )
+    SEEN_RELEASES.update(
+        doc["title"] for doc in mongo_client.releases.find({}, {"title": 1})
+        if "title" in doc
+    )
+
+
+def mark_seen(release_names: List[str]):
+    new_names = [name for name in release_names if name not in SEEN_RELEASES]
+
+    SEEN_RELEASES.update(new_names)
+
+    if not new_names or not config["mongo"]["enabled"]:
+        return
+
+    try:
+        mongo_client.seen.insert_many(
+            [{"release": name} for name in new_names],
+            ordered=False
+        )
+    except pymongo.errors.BulkWriteError:
+        pass
+
+
 def format_exception(exception: Exception) -> str:
     return ''.join(traceback.format_exception(None, exception, exception.__traceback__))
 
@@ -86,7 +189,7 @@ def make_logging_message(level: str, message: str, extras: dict = {}) -> dict:
         "title": "New Logging Message",
         "description": message,
         "color": COLORS.get(level),
-        "timestamp": datetime.fromtimestamp(time.time() - (2 * ONE_HOUR)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        "timestamp": datetime.fromtimestamp(time.time() - (2 * ONE_HOUR))
     })
 
     if not extras:
@@ -119,9 +222,13 @@ def prepare_discord_extras(release_info: dict, twitter_post: str) -> dict:
     }
 
 def log_discord(level: str, message: str, extras: dict = {}):
-    requests.post(
+    SESSION.post(
         config["discord"]["webhook"],
-        json = make_logging_message(level, message, extras),
+        headers={"Content-Type": "application/json"},
+        data = orjson.dumps(
+            make_logging_message(level, message, extras),
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        ),
         timeout=10
     )
 
@@ -135,12 +242,12 @@ def create_ntfy_action(label: str, url: str) -> dict:
 
 
 def log_ntfy(message: str, public: bool = False, actions: list = []):
-     requests.post(
+     SESSION.post(
         config["ntfy"]["server"],
         headers={
             "Authorization": f"Bearer {config['ntfy']['token']}",
         },
-        data = json.dumps({
+        data = orjson.dumps({
             "topic": config["ntfy"]["topic"] if not public else config["ntfy"]["public_topic"],
             "message": message,
             "title": "New Logging Message",
@@ -188,55 +295,118 @@ def request_url(
     if DEBUG:
         log("info", f"[REQ][{caller_name}] Reaching {url}, method: {method}, apply: {apply}, apply_kwargs: {apply_kwargs}, kwargs: {kwargs}")
     try:
-        response: requests.Response = getattr(requests, method)(url, timeout=10, **kwargs)
+        response: requests.Response = SESSION.request(method.upper(), url, timeout=10, **kwargs)
 
     except requests.RequestException as exception:
         log("error", f"[REQ][{caller_name}] Reaching {url} failed: ```{format_exception(exception)}```")
         return default if not return_status_code else exception.response.status_code
-    
+
+    if response.status_code == 304:
+        return default if not return_status_code else response.status_code
+
     if response.status_code not in range(200, 299):
         log("error", f"[REQ][{caller_name}] Non-200 response: {response.status_code} - `{response.text}`")
         return default if not return_status_code else response.status_code
-    
+
+    if apply == "json":
+        return orjson.loads(response.content)
+
     return getattr(response, apply)(**apply_kwargs) if apply else response
 
 
-def scan_srrdb() -> dict:
-    return request_url(SRRDB_SCAN_URL, "SCN", apply="json")["results"]
+async def request_url_async(
+        url: str,
+        caller_name: str,
+        method: str = "get",
+        default: Any = None,
+        apply: str = None,
+        return_status_code: bool = False,
+        **kwargs
+    ):
+    if DEBUG:
+        log("info", f"[REQ][{caller_name}] Reaching {url}, method: {method}, apply: {apply}, kwargs: {kwargs}")
+    try:
+        async with AIOHTTP_SESSION.request(
+            method.upper(), url, timeout=aiohttp.ClientTimeout(total=10), **kwargs
+        ) as response:
+            if response.status not in range(200, 299):
+                log("error", f"[REQ][{caller_name}] Non-200 response: {response.status} - `{await response.text()}`")
+                return default if not return_status_code else response.status
 
+            if apply == "json":
+                return orjson.loads(await response.read())
 
-def find_new_releases(releases: List[dict]) -> Generator[dict, None, None]:
-    
-    for release in releases:
-        release_hash = md5(release["release"].encode()).hexdigest()
+            return await response.read()
 
-        if release_hash in OLD_HASH_SET:
-            continue
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+        log("error", f"[REQ][{caller_name}] Reaching {url} failed: ```{format_exception(exception)}```")
+        return default
 
-        OLD_HASH_SET.add(release_hash)
 
-        if (
-            config["mongo"]["enabled"] and
-            mongo_client.releases.find_one({"title": release["release"]})
-        ):
-            continue
-        
-        yield release
+async def fetch_media(url: str, caller_name: str) -> Optional[SpooledTemporaryFile]:
+    if DEBUG:
+        log("info", f"[REQ][{caller_name}] Streaming {url}")
+    try:
+        async with AIOHTTP_SESSION.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status not in range(200, 299):
+                log("error", f"[REQ][{caller_name}] Non-200 response: {response.status} - `{await response.text()}`")
+                return
+
+            if (response.content_length or 0) > MAX_MEDIA_BYTES:
+                log("error", f"[REQ][{caller_name}] Response from {url} exceeds {MAX_MEDIA_BYTES} bytes")
+                return
+
+            spooled = SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+
+            async for chunk in response.content.iter_chunked(65536):
+                spooled.write(chunk)
+
+            spooled.seek(0)
+            return spooled
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+        log("error", f"[REQ][{caller_name}] Reaching {url} failed: ```{format_exception(exception)}```")
+        return
+
+
+def scan_srrdb() -> Optional[List[dict]]:
+    headers = {"If-None-Match": SCAN_STATE["etag"]} if SCAN_STATE["etag"] else {}
+
+    response = request_url(SRRDB_SCAN_URL, "SCN", headers=headers)
+
+    if not response:
+        return
+
+    SCAN_STATE["etag"] = response.headers.get("ETag")
+
+    return orjson.loads(response.content)["results"]
+
+
+def find_new_releases(releases: List[dict]) -> Generator[dict, None, None]:
+    new_releases = [
+        release for release in releases
+        if release["release"] not in SEEN_RELEASES
+    ]
+
+    mark_seen([release["release"] for release in new_releases])
 
+    yield from new_releases
 
-def get_details(release_name: str) -> dict:
+
+async def get_details(release_name: str) -> dict:
     if release_name in CACHE["releases"]:
         return CACHE["releases"][release_name]
-    
-    details = request_url(SRRDB_RELEASE_URL.format(release_name=release_name), "DET", apply="json")
+
+    details = await request_url_async(SRRDB_RELEASE_URL.format(release_name=release_name), "DET", apply="json")
     CACHE["releases"][release_name] = details
     return details
  
 
+@lru_cache(maxsize=4096)
 def mask_title_id(title_id: str) -> str:
-    return "0" + hex(
-        int(title_id, 16) & TITLE_ID_BASE_MASK
-    )[2:].upper()
+    return f"{int(title_id, 16) & TITLE_ID_BASE_MASK:016X}"
 
 
 def find_first_true(iterable: Iterable[T], func: Callable[[T], bool], default: Optional[T] = None) -> T:
@@ -247,45 +417,60 @@ def find_first_true(iterable: Iterable[T], func: Callable[[T], bool], default: O
     return default    
 
 
-def parse_nfo(nfo_url: str) -> Tuple[str, str]:
+async def parse_nfo(nfo_url: str, release_name: str) -> Tuple[str, str]:
+    if config["mongo"]["enabled"]:
+        cached = mongo_client.nfos.find_one({"release": release_name})
+
+        if cached:
+            CACHE["nfos"][cached["tid"]] = cached["nfo"]
+            return cached["tid"], cached["masked_tid"]
+
     log("info", f"[NFO] Parsing {nfo_url}")
-    nfo = request_url(nfo_url, "NFO", return_status_code=True)
-    
-    if isinstance(nfo, int) or not nfo:
-        return nfo
+    raw_nfo = await request_url_async(nfo_url, "NFO", return_status_code=True)
 
-    nfo = nfo.content.decode("cp437")
+    if isinstance(raw_nfo, int) or not raw_nfo:
+        return raw_nfo
 
-    title_id = TITLE_ID_REGEX.search(nfo)
+    title_id = TITLE_ID_REGEX.search(raw_nfo)
 
     if not title_id:
         log("error", f"[NFO] Could not parse Title ID from {nfo_url}")
         return
 
-    title_id = title_id.group().replace("X", "0")
+    title_id = title_id.group().decode().replace("X", "0")
     masked_title_id = mask_title_id(title_id)
 
     if title_id not in CACHE["nfos"]:
-        CACHE["nfos"][title_id] = nfo
+        CACHE["nfos"][title_id] = raw_nfo.decode("cp437")
+
+    if config["mongo"]["enabled"]:
+        try:
+            mongo_client.nfos.insert_one({
+                "release": release_name,
+                "tid": title_id,
+                "masked_tid": masked_title_id,
+                "nfo": CACHE["nfos"][title_id]
+            })
+        except pymongo.errors.DuplicateKeyError:
+            pass
 
     return title_id, masked_title_id
 
 
 def humansize(size: int) -> str:
-    suffixes = ['B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB']
-    index = 0
+    if size < 1024:
+        return f"{size} B"
 
-    while size >= 1024 and index < len(suffixes)-1:
-        size /= 1024.
-        index += 1
-    
-    size = ('%.2f' % size).rstrip('0').rstrip('.')
+    suffixes = ('B', 'KiB', 'MiB', 'GiB', 'TiB', 'PiB')
+    index = min((size.bit_length() - 1) // 10, len(suffixes) - 1)
 
-    return '%s %s' % (size, suffixes[index])
+    scaled = ('%.2f' % (size / (1 << (10 * index)))).rstrip('0').rstrip('.')
 
+    return '%s %s' % (scaled, suffixes[index])
 
-def get_info(release_name: str) -> dict:
-    details = get_details(release_name)
+
+async def get_info(release_name: str) -> dict:
+    details = await get_details(release_name)
 
     if not details:
         return
@@ -313,7 +498,7 @@ def get_info(release_name: str) -> dict:
     if not nfo_file:
         return
 
-    parse_result = parse_nfo(nfo_url)
+    parse_result = await parse_nfo(nfo_url, release_name)
 
     if isinstance(parse_result, int):
         return parse_result
@@ -331,27 +516,24 @@ def get_info(release_name: str) -> dict:
         "crc": crc,
         "proof": proof_url,
         "nfo": nfo_url,
-        "thumb": TINFOIL_URL.format(title_id=masked_title_id)
+        "thumb": TINFOIL_URL.format(title_id=masked_title_id),
+        "tinfoil_url": TINFOIL_TITLE_URL.format(title_id=masked_title_id),
+        "eshop_url": ESHOP_URL.format(title_id=masked_title_id)
     }
 
 
 def add_to_mongo(release_info: dict):
     log("info", f"[MDB] Adding {release_info['title']} to MongoDB")
-    mongo_client.releases.insert_one(release_info)
+    INSERT_QUEUE.put(release_info)
 
 
 def render_nfo(release_info: dict) -> Image.Image:
-    log("info", f"[NFO] Rendering {release_info['title']} NFO with custom renderer")
-
-    nfo_font = ImageFont.truetype(
-        config["render"]["font_path"],
-        size=config["render"]["font_size"],
-        encoding='unic'
-    )
+    log("info", f"[NFO] Rendering {release_info['title']} NFO with custom renderer", silent=True)
 
     nfo_font_height = config["render"]["font_size"]
 
-    nfo_lines = CACHE["nfos"][release_info["tid"]].split("\n")
+    nfo_text = CACHE["nfos"][release_info["tid"]]
+    nfo_lines = nfo_text.split("\n")
     longest_line = max(len(line) for line in nfo_lines)
 
     nfo_size = (
@@ -361,27 +543,25 @@ def render_nfo(release_info: dict) -> Image.Image:
 
     rendered_nfo = Image.new(
         "RGB", nfo_size, config["render"]["background"])
-    
+
     nfo_draw = ImageDraw.Draw(rendered_nfo)
-    current_offset = 0
-
-    for line in nfo_lines:
-        nfo_draw.text(
-            (0, current_offset),
-            line,
-            font=nfo_font,
-            fill=config["render"]["foreground"]
-        )
-        current_offset += nfo_font_height
-    
+
+    nfo_draw.multiline_text(
+        (0, 0),
+        nfo_text,
+        font=NFO_FONT,
+        spacing=nfo_font_height - nfo_draw.textbbox((0, 0), "A", font=NFO_FONT)[3],
+        fill=config["render"]["foreground"]
+    )
+
     return rendered_nfo
 
 
-def render_nfo_pyansi(release_info: dict) -> Image.Image:
-    log("info", f"[NFO] Rendering {release_info['title']} NFO with pyansi")
+def render_nfo_pyansi(release_info: dict) -> bytes:
+    log("info", f"[NFO] Rendering {release_info['title']} NFO with pyansi", silent=True)
     with (
-        NamedTemporaryFile(mode="w", suffix=".nfo") as nfo_file,
-        NamedTemporaryFile(mode="w", suffix=".png") as image_file
+        NamedTemporaryFile(mode="w", suffix=".nfo", dir=SHM_DIR) as nfo_file,
+        NamedTemporaryFile(suffix=".png", dir=SHM_DIR) as image_file
     ):
         nfo_file.write(CACHE["nfos"][release_info["tid"]])
         nfo_file.flush()
@@ -394,36 +574,55 @@ def render_nfo_pyansi(release_info: dict) -> Image.Image:
             )
         )
 
-        rendered_nfo = Image.open(image_file.name)
-        rendered_nfo.load()
-    
+        rendered_nfo = image_file.read()
+
     return rendered_nfo
 
 
-def render_nfo_infekt(release_info: dict) -> Image.Image:
-    log("info", f"[NFO] Rendering {release_info['title']} NFO with infekt")
+def render_nfo_infekt(release_info: dict) -> bytes:
+    log("info", f"[NFO] Rendering {release_info['title']} NFO with infekt", silent=True)
 
-    with (
-        NamedTemporaryFile(mode="w", suffix=".nfo") as nfo_file,
-        NamedTemporaryFile(mode="r", suffix=".png") as image_file
-    ):
-        nfo_file.write(CACHE["nfos"][release_info["tid"]])
-        nfo_file.flush()
+    result = subprocess.run([
+        "infekt-cli", "-", "-O", "-",
+        "-T", "ffffff", "-B", "000000", "-c"
+    ],
+        input=CACHE["nfos"][release_info["tid"]].encode("cp437"),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
 
-        result = subprocess.run([
-            "infekt-cli", nfo_file.name, "-O", image_file.name,
-            "-T", "ffffff", "-B", "000000", "-c"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0 or result.stderr or not result.stdout:
+        log("warning", f"[NFO] Could not render {release_info['title']} NFO with infekt", silent=True)
 
-        if result.returncode != 0 or result.stderr:
-            log("warning", f"[NFO] Could not render {release_info['title']} NFO with infekt")
+        with BytesIO() as fallback_buffer:
+            render_nfo(release_info).save(fallback_buffer, format="png")
+            return fallback_buffer.getvalue()
 
-            return render_nfo(release_info)
+    return result.stdout
 
-        rendered_nfo = Image.open(image_file.name)
-        rendered_nfo.load()
-    
-    return rendered_nfo
+
+def render_and_encode(release_info: dict, nfo_text: str) -> bytes:
+    CACHE["nfos"][release_info["tid"]] = nfo_text
+
+    renderer = config["render"]["renderer"]
+
+    if renderer == "pyansi":
+        return render_nfo_pyansi(release_info)
+
+    if renderer == "infekt":
+        return render_nfo_infekt(release_info)
+
+    if renderer == "builtin":
+        with BytesIO() as buffer:
+            render_nfo(release_info).save(
+                buffer,
+                format="jpeg",
+                quality=85,
+                subsampling=2,
+                optimize=True
+            )
+            return buffer.getvalue()
+
+    raise ValueError(f"Unknown renderer {renderer}")
 
 
 def upload_nfo(release_info: dict, buffer: BytesIO, mode: str) -> str:
@@ -458,8 +657,8 @@ New Release by {title[title.rfind('-')+1:]}!
 {title} [{release_info["tid"]}][{release_info["crc"]}]
 Size: {release_info["size"]}
 
-View on Tinfoil: https://tinfoil.io/Title/{release_info["masked_tid"]}
-View on eShop: https://ec.nintendo.com/apps/{release_info["masked_tid"]}/US
+View on Tinfoil: {release_info["tinfoil_url"]}
+View on eShop: {release_info["eshop_url"]}
 """
     
     return {
@@ -469,18 +668,15 @@ View on eShop: https://ec.nintendo.com/apps/{release_info["masked_tid"]}/US
 
 
 def generate_oauth_headers(sign_headers: dict, url: str, content: dict = None, multipart: bool = False) -> dict:
-    ouath_client = oauth1.Client(
-        client_key              = config["twitter"]["consumer_key"],
-        client_secret           = config["twitter"]["consumer_secret"],
-        resource_owner_key      = config["twitter"]["access_token"],
-        resource_owner_secret   = config["twitter"]["access_token_secret"],
-    )
-    _, headers, _ = ouath_client.sign(
+    if isinstance(content, bytes):
+        content = content.decode()
+
+    _, headers, _ = OAUTH_CLIENT.sign(
         http_method = "POST",
         body = content,
         uri = url,
         headers=sign_headers
-    ) if not multipart else ouath_client.sign(
+    ) if not multipart else OAUTH_CLIENT.sign(
         http_method = "POST",
         uri = url
     )
@@ -504,59 +700,68 @@ def do_twitter_request(url: str, sign_headers: dict, caller_name: str, multipart
     )
 
 
-def upload_media(release_info: dict):
-    log("info", f"[UMD] Uploading media for {release_info['title']}")
+async def upload_one_media(
+        release_info: dict,
+        image_type: str,
+        prefetch: Optional[asyncio.Task] = None
+    ) -> Optional[dict]:
+    log("info", f"[UMD] Uploading {image_type} media for {release_info['title']}: {release_info[image_type]}")
 
-    release_info["media"] = []
+    media_file = await prefetch if prefetch else await fetch_media(release_info[image_type], "UMD")
 
-    for image_type in ["thumb", "nfo", "proof"]:
-        if not release_info[image_type]:
-            continue
+    if media_file is None:
+        return
 
-        log("info", f"[UMD] Uploading {image_type} media for {release_info['title']}: {release_info[image_type]}")
+    with media_file:
+        form = aiohttp.FormData()
+        form.add_field(
+            "media",
+            media_file,
+            filename=f"{image_type}_{release_info['tid']}.jpg"
+        )
 
-        media_info = {
-            "url": release_info[image_type],
-        }
+        response = await request_url_async(
+            TWITTER_MEDIA_ENDPOINT_URL,
+            "UMD",
+            method="post",
+            apply="json",
+            headers=generate_oauth_headers({}, TWITTER_MEDIA_ENDPOINT_URL, multipart=True),
+            data=form
+        )
 
-        image_content = request_url(release_info[image_type], "UMD")
+    if not response:
+        return
 
-        if not image_content:
-            continue
+    return {"url": release_info[image_type]} | response
 
-        with BytesIO(
-            image_content.content
-        ) as io:
-            response = do_twitter_request(
-                TWITTER_MEDIA_ENDPOINT_URL,
-                {},
-                caller_name = "UMD",
-                files = {
-                    "media": (f"{image_type}_{release_info['tid']}.jpg", io)
-                }
-            )
 
-        if not response:
-            continue
-        
-        release_info["media"].append(media_info | response)
+async def upload_media(release_info: dict, prefetched: dict = {}):
+    log("info", f"[UMD] Uploading media for {release_info['title']}")
+
+    uploads = await asyncio.gather(*[
+        upload_one_media(release_info, image_type, prefetched.get(image_type))
+        for image_type in ("thumb", "nfo", "proof")
+        if release_info[image_type]
+    ])
 
+    release_info["media"] = [upload for upload in uploads if upload]
 
-def post_to_twitter(release_info: dict) -> Tuple[dict, dict]:
+
+async def post_to_twitter(release_info: dict, prefetched: dict = {}) -> Tuple[dict, dict]:
     log("info", f"[TWT] Posting to Twitter")
 
-    upload_media(release_info)
+    await upload_media(release_info, prefetched)
     content = make_twitter_post(release_info)
 
     return content, do_twitter_request(
         POST_TWEET_URL,
         {"Content-Type": "application/json"},
         caller_name = "TWT",
-        data = json.dumps(content)
+        data = orjson.dumps(content)
     )
 
 
-def handle_releases(releases: List[dict]) -> None:
+async def handle_releases(releases: List[dict]) -> None:
     for release in releases:
         release_name = release["release"]
         log("info", f"[REL] Found new release: {release_name}", publish=True)
@@ -565,48 +770,45 @@ def handle_releases(releases: List[dict]) -> None:
             log("warning", f"[REL] Release {release_name} has no NFO", publish=True)
             continue
         
-        release_info = get_info(release_name)
+        release_info = await get_info(release_name)
 
         if not release_info or isinstance(release_info, int) and release_info == 404:
             log("warning", f"[REL] Release {release_name} has no NFO", publish=True)
-            
-            OLD_HASH_SET.add(
-                md5(release_name.encode()).hexdigest()
-            )
-
-            add_to_mongo({
-                "title": release_name,
-            })
-
             continue
 
         elif isinstance(release_info, int) and release_info == 429:
             log("warning", f"[REL] Ratelimit reached")
-            sleep(ONE_HOUR)
+            await asyncio.sleep(ONE_HOUR)
             continue
 
-        with BytesIO() as buffer:
-            if config["render"]["renderer"] == "pyansi":
-                mode = "png"
-                render_nfo_pyansi(release_info).save(buffer, format=mode)
-
-            elif config["render"]["renderer"] == "builtin":
-                mode = "jpeg"
-                render_nfo(release_info).save(buffer, format=mode)
-            
-            elif config["render"]["renderer"] == "infekt":
-                mode = "png"
-                render_nfo_infekt(release_info).save(buffer, format=mode)
+        render_task = asyncio.get_running_loop().run_in_executor(
+            RENDER_POOL,
+            render_and_encode,
+            release_info,
+            CACHE["nfos"][release_info["tid"]]
+        )
 
-            else:
-                raise ValueError(f"Unknown renderer {config['render']['renderer']}")
+        prefetched = {
+            image_type: asyncio.create_task(fetch_media(release_info[image_type], "UMD"))
+            for image_type in ("thumb", "proof")
+            if release_info[image_type]
+        }
 
-            buffer.seek(0)
+        mode = "jpeg" if config["render"]["renderer"] == "builtin" else "png"
 
-            if not upload_nfo(release_info, buffer, mode):
-                continue
-        
-        post, response = post_to_twitter(release_info)
+        with BytesIO(await render_task) as buffer:
+            uploaded = upload_nfo(release_info, buffer, mode)
+
+        if not uploaded:
+            for prefetch in prefetched.values():
+                media_file = await prefetch
+
+                if media_file is not None:
+                    media_file.close()
+
+            continue
+
+        post, response = await post_to_twitter(release_info, prefetched)
 
         if not response:
             continue
@@ -621,9 +823,9 @@ def handle_releases(releases: List[dict]) -> None:
             f"[REL] {post['text']}\n\n{NEWLINE.join(media['url'] for media in release_info['media'])}",
             publish=True,
             ntfy_actions=[
-                create_ntfy_action("View on Twitter", f"{TWITTER_BASE_URL}/{config['twitter']['username']}/status/{response['data']['id']}"),
-                create_ntfy_action("View on Tinfoil", f"https://tinfoil.io/Title/{release_info['masked_tid']}"),
-                create_ntfy_action("View on eShop", f"https://ec.nintendo.com/apps/{release_info['masked_tid']}/US")
+                create_ntfy_action("View on Twitter", TWITTER_POST_URL),
+                create_ntfy_action("View on Tinfoil", release_info["tinfoil_url"]),
+                create_ntfy_action("View on eShop", release_info["eshop_url"])
             ],
             extras=prepare_discord_extras(release_info, TWITTER_POST_URL)
         )
@@ -631,22 +833,40 @@ def handle_releases(releases: List[dict]) -> None:
         if config["common"]["debug"]:
             return
 
-        time.sleep(ONE_MINUTE)
+        await asyncio.sleep(POST_COOLDOWN)
+
 
+async def main_loop():
+    global AIOHTTP_SESSION
 
-def main_loop():
     log("info", "[MLP] Starting Main Loop")
 
-    while True:
-        releases = scan_srrdb()
-        releases = find_new_releases(releases)
-        handle_releases(releases)
+    init_mongo()
 
-        if config["common"]["debug"]:
-            return
+    consecutive_empty = 0
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, limit_per_host=8)
+    ) as session:
+        AIOHTTP_SESSION = session
+
+        while True:
+            releases = scan_srrdb()
+            new_releases = list(find_new_releases(releases)) if releases else []
 
-        time.sleep(ONE_MINUTE)
+            if new_releases:
+                consecutive_empty = 0
+                await handle_releases(new_releases)
+            else:
+                consecutive_empty += 1
+
+            if config["common"]["debug"]:
+                return
+
+            await asyncio.sleep(
+                min(ONE_MINUTE * 2 ** consecutive_empty, ONE_HOUR)
+            )
 
 
 if __name__ == "__main__":
-    main_loop()
\ No newline at end of file
+    asyncio.run(main_loop())
\ No newline at end of file